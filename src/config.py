@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+# Process-wide snapshot of the environment settings read by `services.*`.
+# Read once at import (after `load_dotenv()` in the app); call `reload_env()`
+# to pick up changes. Access as `config.OFFLINE` etc. so reloads are visible.
+OFFLINE: bool = True
+API_KEY: str = ""
+MODEL_NAME: Optional[str] = None  # services apply their own default model
+ALLOW_STATS_RESET: bool = False   # stats.json is shared by every visitor
+
+
+def reload_env() -> None:
+    """Re-read OFFLINE_MODE / OPENAI_API_KEY / MODEL_NAME / ALLOW_STATS_RESET from the environment."""
+    global OFFLINE, API_KEY, MODEL_NAME, ALLOW_STATS_RESET
+    OFFLINE = os.getenv("OFFLINE_MODE", "true").lower() == "true"
+    API_KEY = os.getenv("OPENAI_API_KEY", "")
+    MODEL_NAME = os.getenv("MODEL_NAME") or None
+    ALLOW_STATS_RESET = os.getenv("ALLOW_STATS_RESET", "false").lower() == "true"
+
+
+reload_env()
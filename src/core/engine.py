@@ -1,6 +1,10 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Callable
-from .state import GameState
+from .state import GameState, GameStatus, is_az, letter_bit, mask_to_display
+
+# Engine input is restricted to ASCII a–z (`is_az`), the letters a guessed-letter mask can hold.
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
 
 
 def new_game(difficulty: str, picker_fn: Callable[[str], str], max_wrong: int = 6) -> GameState:
@@ -24,50 +28,46 @@ def new_game(difficulty: str, picker_fn: Callable[[str], str], max_wrong: int =
     """
     word = (picker_fn(difficulty) or "").strip().lower()
     # Defensive fallback in case a buggy picker returns an invalid word.
-    if not word.isalpha():
+    if not is_az(word):
         word = "python"
-    return GameState(secret_word=word, guessed=set(), wrong_count=0, max_wrong=max_wrong, status="playing")
+    return GameState(secret_word=word, guessed_mask=0, wrong_count=0, max_wrong=max_wrong, status="playing")
 
 
-def mask_word(secret: str, guessed: set[str]) -> str:
+@lru_cache(maxsize=256)
+def mask_word(secret: str, guessed_mask: int) -> str:
     """
     Return a masked representation of the secret word, e.g., '_ p p l e'.
 
     Notes
     -----
-    - Reveals letters that have been guessed; hides the others as underscores.
+    - Reveals letters whose bit is set in `guessed_mask`; hides the others as underscores.
     - Spaces are added between characters for readability in the UI.
+    - Memoized: `(secret, guessed_mask)` fully determines the output, so the board,
+      the coach and the history log share one computation per state across reruns.
+      A game visits at most 27 masks, so the cache holds several live sessions' games.
     """
-    return " ".join(c if c in guessed else "_" for c in secret)
+    hidden = "".join(c for i, c in enumerate(_LETTERS) if not guessed_mask >> i & 1)
+    return " ".join(secret.translate(str.maketrans(hidden, "_" * len(hidden))))
 
 
-def _check_outcome(state: GameState) -> GameState:
+def _outcome(secret_mask: int, guessed_mask: int, wrong_count: int, max_wrong: int) -> GameStatus:
     """
-    Compute the derived status (won/lost/playing) based on the current fields.
+    Compute the derived status (won/lost/playing) for the fields of the next state.
 
     Rules
     -----
-    - Won  : all distinct letters in `secret_word` have been guessed.
+    - Won  : all distinct letters in the secret word have been guessed.
     - Lost : `wrong_count >= max_wrong`.
     - Else : playing.
+
+    Taking the raw fields (rather than a GameState) lets each transition build
+    exactly one new state with its final status.
     """
-    if all(c in state.guessed for c in set(state.secret_word)):
-        return GameState(
-            secret_word=state.secret_word,
-            guessed=set(state.guessed),
-            wrong_count=state.wrong_count,
-            max_wrong=state.max_wrong,
-            status="won",
-        )
-    if state.wrong_count >= state.max_wrong:
-        return GameState(
-            secret_word=state.secret_word,
-            guessed=set(state.guessed),
-            wrong_count=state.wrong_count,
-            max_wrong=state.max_wrong,
-            status="lost",
-        )
-    return state  # unchanged (still playing)
+    if (secret_mask & ~guessed_mask) == 0:
+        return "won"
+    if wrong_count >= max_wrong:
+        return "lost"
+    return "playing"
 
 
 def guess_letter(state: GameState, ch: str) -> GameState:
@@ -77,33 +77,36 @@ def guess_letter(state: GameState, ch: str) -> GameState:
     Behavior
     --------
     - Ignores input if game is not in "playing" status.
-    - Ignores non-alphabetic or multi-character inputs.
+    - Ignores multi-character inputs and anything outside a–z (case-insensitive).
     - Repeated guesses are no-ops (idempotent).
     - Increments `wrong_count` by 1 if the letter is not in the secret word.
-    - Calls `_check_outcome` to update status if the guess ends the game.
+    - Uses `_outcome` to set the status if the guess ends the game.
     """
     if state.status != "playing":
         return state
 
-    if not isinstance(ch, str) or len(ch) != 1 or not ch.isalpha():
+    if not isinstance(ch, str) or len(ch) != 1:
         return state  # ignore invalid input silently
 
     ch = ch.lower()
-    if ch in state.guessed:
+    if not is_az(ch):
+        return state  # ignore non a–z input silently
+    bit = letter_bit(ch)
+    if state.guessed_mask & bit:
         return state  # repeated guess; no changes
 
-    new_guessed = set(state.guessed)
-    new_guessed.add(ch)
-    wrong = state.wrong_count + (0 if ch in state.secret_word else 1)
+    guessed_mask = state.guessed_mask | bit
+    wrong = state.wrong_count + (0 if state.secret_mask & bit else 1)
 
-    new_state = GameState(
+    return GameState._unchecked(
         secret_word=state.secret_word,
-        guessed=new_guessed,
+        guessed_mask=guessed_mask,
         wrong_count=wrong,
         max_wrong=state.max_wrong,
-        status=state.status,
+        status=_outcome(state.secret_mask, guessed_mask, wrong, state.max_wrong),
+        secret_mask=state.secret_mask,
+        guessed_display=mask_to_display(guessed_mask),
     )
-    return _check_outcome(new_state)
 
 
 def guess_word(state: GameState, word: str) -> GameState:
@@ -113,7 +116,7 @@ def guess_word(state: GameState, word: str) -> GameState:
     Behavior
     --------
     - Ignores input if game is not in "playing" status.
-    - Non-alphabetic inputs are ignored.
+    - Inputs that are not purely a–z (case-insensitive) are ignored.
     - If the guess matches `secret_word` (case-insensitive), the game is won and
       all letters are considered revealed.
     - Otherwise, counts as a single wrong guess (`wrong_count += 1`).
@@ -122,25 +125,30 @@ def guess_word(state: GameState, word: str) -> GameState:
         return state
 
     attempt = (word or "").strip().lower()
-    if not attempt.isalpha():
+    if not is_az(attempt):
         return state  # ignore invalid whole-word attempts
 
     if attempt == state.secret_word:
-        # Win immediately; reveal all letters by setting guessed to the full set.
-        return GameState(
+        # Win immediately; reveal all letters by marking every secret letter guessed.
+        guessed_mask = state.guessed_mask | state.secret_mask
+        return GameState._unchecked(
             secret_word=state.secret_word,
-            guessed=set(state.secret_word),
+            guessed_mask=guessed_mask,
             wrong_count=state.wrong_count,
             max_wrong=state.max_wrong,
             status="won",
+            secret_mask=state.secret_mask,
+            guessed_display=mask_to_display(guessed_mask),
         )
 
     # Wrong whole-word attempt costs exactly one strike.
-    new_state = GameState(
+    wrong = state.wrong_count + 1
+    return GameState._unchecked(
         secret_word=state.secret_word,
-        guessed=set(state.guessed),
-        wrong_count=state.wrong_count + 1,
+        guessed_mask=state.guessed_mask,
+        wrong_count=wrong,
         max_wrong=state.max_wrong,
-        status=state.status,
+        status=_outcome(state.secret_mask, state.guessed_mask, wrong, state.max_wrong),
+        secret_mask=state.secret_mask,
+        guessed_display=state.guessed_display,
     )
-    return _check_outcome(new_state)
@@ -1,12 +1,56 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Literal, Set
+from typing import FrozenSet, Iterable, Literal, NamedTuple
 
 
 GameStatus = Literal["playing", "won", "lost"]
 
 
+class HistoryEntry(NamedTuple):
+    """One recorded move (logged by the UI, read by the post-game review)."""
+    type: Literal["letter", "word"]
+    guess: str
+    hit: bool
+    mask: str         # masked word right after the move
+    wrong_count: int
+
+# Letters are tracked as a 26-bit mask: bit i set <=> chr(ord('a') + i) guessed.
+_ALL_LETTERS_MASK = (1 << 26) - 1
+_AZ_RE = re.compile(r"[a-z]+")
+_LETTER_BITS = {chr(97 + i): 1 << i for i in range(26)}
+
+
+def letter_bit(ch: str) -> int:
+    """Return the single-bit mask for a lowercase letter a–z."""
+    return 1 << (ord(ch) - 97)
+
+
+def is_az(text: str) -> bool:
+    """True if `text` is a non-empty run of ASCII a–z (the only letters a mask can hold)."""
+    return _AZ_RE.fullmatch(text) is not None
+
+
+def letters_to_mask(letters: Iterable[str]) -> int:
+    """Fold lowercase letters a–z into a 26-bit mask (other characters are ignored)."""
+    bits = _LETTER_BITS
+    m = 0
+    for c in letters:
+        m |= bits.get(c, 0)
+    return m
+
+
+def mask_to_letters(mask: int) -> FrozenSet[str]:
+    """Expand a 26-bit letter mask back into the (immutable) set of letters it contains."""
+    return frozenset(chr(97 + i) for i in range(26) if mask >> i & 1)
+
+
+def mask_to_display(mask: int) -> str:
+    """Render a letter mask as 'a, e, t' (alphabetical; empty string if no bits are set)."""
+    return ", ".join(chr(97 + i) for i in range(26) if mask >> i & 1)
+
+
 @dataclass(frozen=True)
 class GameState:
     """
@@ -24,36 +68,76 @@ class GameState:
 
     # Core fields
     secret_word: str
-    guessed: Set[str] = field(default_factory=set)
+    guessed_mask: int = 0
     wrong_count: int = 0
     max_wrong: int = 6
     status: GameStatus = "playing"
 
+    # Derived fields (computed in __post_init__)
+    secret_mask: int = field(default=0, init=False, repr=False, compare=False)
+    guessed_display: str = field(default="", init=False, repr=False, compare=False)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        secret_word: str,
+        guessed_mask: int,
+        wrong_count: int,
+        max_wrong: int,
+        status: GameStatus,
+        secret_mask: int,
+        guessed_display: str,
+    ) -> "GameState":
+        """
+        Build a state from already-normalized, already-valid fields, skipping `__post_init__`.
+
+        Notes
+        -----
+        - For `core.engine` transitions derived from an existing (validated) state only;
+          everything else should go through the normal constructor.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "secret_word", secret_word)
+        object.__setattr__(self, "guessed_mask", guessed_mask)
+        object.__setattr__(self, "wrong_count", wrong_count)
+        object.__setattr__(self, "max_wrong", max_wrong)
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "secret_mask", secret_mask)
+        object.__setattr__(self, "guessed_display", guessed_display)
+        return self
+
+    @property
+    def guessed(self) -> FrozenSet[str]:
+        """Guessed letters as a frozenset (materialized from `guessed_mask` on access)."""
+        return mask_to_letters(self.guessed_mask)
+
     def __post_init__(self) -> None:
         """
         Normalize and validate fields.
 
         Normalization
         -------------
-        - `secret_word` is lowercased.
-        - `guessed` letters are lowercased and restricted to a–z.
+        - `secret_word` is lowercased; `secret_mask` caches its distinct letters as bits.
+        - `guessed_mask` is restricted to the 26 bits for a–z; `guessed_display`
+          caches it as sorted, comma-separated letters for the UI.
 
         Validation
         ----------
         - `max_wrong` must be >= 1.
         - `wrong_count` must be >= 0.
         - `status` must be one of {"playing", "won", "lost"}.
-        - `secret_word` must be non-empty and alphabetic (letters only).
+        - `secret_word` must be non-empty and ASCII letters only (a–z).
         """
         # Because dataclass is frozen, use object.__setattr__ for normalization.
         sw = (self.secret_word or "").strip().lower()
-        if not sw.isalpha():
+        if not is_az(sw):
             raise ValueError("`secret_word` must be non-empty and contain letters only (a–z).")
         object.__setattr__(self, "secret_word", sw)
+        object.__setattr__(self, "secret_mask", letters_to_mask(sw))
 
-        # Normalize guessed letters: lowercase single alphabetic chars only.
-        normalized_guessed = {c.lower() for c in (self.guessed or set()) if c.isalpha() and len(c) == 1}
-        object.__setattr__(self, "guessed", normalized_guessed)
+        # Normalize guessed letters: drop any bits outside a–z.
+        object.__setattr__(self, "guessed_mask", int(self.guessed_mask) & _ALL_LETTERS_MASK)
+        object.__setattr__(self, "guessed_display", mask_to_display(self.guessed_mask))
 
         # Basic numeric checks
         if self.max_wrong < 1:
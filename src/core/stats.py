@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict
+
+
+def empty_stats() -> Dict[str, int]:
+    """Fresh zeroed counters (games / wins / losses / total mistakes)."""
+    return {"games": 0, "wins": 0, "losses": 0, "mistakes": 0}
+
+
+class StatsStore:
+    """
+    Write-through stats counters backed by a small JSON file.
+
+    The file is read once on construction and rewritten only when a round is
+    recorded (or the stats are reset), never on a plain rerun. Writes go to a
+    temp file in the same directory and are swapped in with `os.replace`, so a
+    crash mid-write leaves the previous file intact. One instance is meant to
+    be shared by every session, hence the lock.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._stats = self._load()
+
+    def _load(self) -> Dict[str, int]:
+        """Read counters from disk; a missing or unreadable file starts from zero."""
+        stats = empty_stats()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return stats
+        if isinstance(data, dict):
+            for k in stats:
+                v = data.get(k)
+                if isinstance(v, int) and v >= 0:
+                    stats[k] = v
+        return stats
+
+    def _write(self, stats: Dict[str, int]) -> None:
+        """Atomically replace the JSON file with `stats` (caller holds the lock)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stats, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the current counters (safe to read while other sessions record)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def record(self, won: bool, mistakes: int) -> None:
+        """
+        Count one finished round and persist it.
+
+        The in-memory counters change only once the write succeeded; on `OSError`
+        they are left as they were and the error propagates to the caller.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["games"] += 1
+            stats["mistakes"] += mistakes
+            stats["wins" if won else "losses"] += 1
+            self._write(stats)
+            self._stats = stats
+
+    def reset(self) -> None:
+        """Zero all counters and persist (unchanged if the write fails, like `record`)."""
+        with self._lock:
+            stats = empty_stats()
+            self._write(stats)
+            self._stats = stats
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import random
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 # Project-local wordlists live here:
 _DATA_DIR = Path("data/wordlists")
 
+# Shared RNG for unseeded picks: seeded from OS entropy once per process
+# (this module is imported once; the Streamlit script itself re-executes per rerun).
+_RNG = random.Random()
+
 # Default files by difficulty. You can change/extend these later.
 _DEFAULT_FILES = {
     "easy": "easy.txt",
@@ -41,23 +47,128 @@ def _load_words_for_files(files: Iterable[str]) -> List[str]:
     return words
 
 
-def load_wordlist(difficulty: str = "medium") -> List[str]:
+# Last-resort words when no wordlist file yields anything (e.g. the app was
+# started from another working directory, since `_DATA_DIR` is relative).
+_FALLBACK_WORDS: Tuple[str, ...] = ("python", "stream", "planet")
+
+
+class _NoWordlist(LookupError):
+    """No wordlist file yielded words; raised (never cached) by the cached loaders."""
+
+
+@lru_cache(maxsize=8)
+def _load_wordlist_files(difficulty: str) -> Tuple[str, ...]:
+    """Words from the files for `difficulty` (medium as a fallback); `_NoWordlist` if none."""
+    primary = _DEFAULT_FILES.get(difficulty, _DEFAULT_FILES["medium"])
+    words = _load_words_for_files([primary])
+    if not words:
+        words = _load_words_for_files([_DEFAULT_FILES["medium"]])
+    if not words:
+        raise _NoWordlist(difficulty)
+    return tuple(words)
+
+
+def load_wordlist(difficulty: str = "medium") -> Tuple[str, ...]:
     """
-    Load a list of candidate words for the given difficulty.
+    Load the candidate words for the given difficulty.
 
     Fallback strategy
     -----------------
     1) Use the file mapped by `difficulty` in `_DEFAULT_FILES`.
     2) If empty/missing, use "medium.txt".
     3) If still empty, return a tiny built-in list as a last resort.
+
+    Notes
+    -----
+    - Words read from files are cached per difficulty for the life of the process
+      and returned as an immutable tuple; call `clear_wordlist_caches()` (or restart
+      the app) after editing the files.
+    - The built-in fallback is never cached, so a later call that can read the
+      files (e.g. once the files exist) picks them up.
     """
-    primary = _DEFAULT_FILES.get(difficulty, _DEFAULT_FILES["medium"])
-    words = _load_words_for_files([primary])
-    if not words:
-        words = _load_words_for_files([_DEFAULT_FILES["medium"]])
-    if not words:
-        words = ["python", "stream", "planet"]  # last-resort fallback
-    return words
+    try:
+        return _load_wordlist_files(difficulty)
+    except _NoWordlist:
+        return _FALLBACK_WORDS
+
+
+@dataclass(frozen=True, eq=False)
+class WordIndex:
+    """
+    Column-oriented view of a wordlist for fast candidate filtering.
+
+    Notes
+    -----
+    - The `*_bits` fields are bitsets over word indices: arbitrary-precision ints
+      whose bit i stands for `words[i]`. Bitwise ops and `int.bit_count()` on them
+      run over the whole list in C.
+      - `letter_bits[c]`: words containing chr(ord('a') + c).
+      - `len_bits[n]`: words of length n.
+      - `pos_bits[(p, ch)]`: words with letter `ch` at position `p`.
+    - Compares and hashes by identity (`eq=False`), so an index can key caches
+      without hashing its contents.
+    """
+    words: Tuple[str, ...]
+    letter_bits: Tuple[int, ...]
+    len_bits: Dict[int, int]
+    pos_bits: Dict[Tuple[int, str], int]
+
+
+def _pack_bits(indices: Iterable[int], n: int) -> int:
+    """Pack word indices (all < n) into a bitset int (bit i set <=> i in `indices`)."""
+    buf = bytearray((n + 7) >> 3)
+    for i in indices:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def build_word_index(words: Iterable[str]) -> WordIndex:
+    """Precompute the letter / length / position bitset columns for `words` (order preserved)."""
+    ws = tuple(words)
+    n = len(ws)
+    by_letter: List[List[int]] = [[] for _ in range(26)]
+    by_len: Dict[int, List[int]] = {}
+    by_pos: Dict[Tuple[int, str], List[int]] = {}
+    for i, w in enumerate(ws):
+        by_len.setdefault(len(w), []).append(i)
+        for p, ch in enumerate(w):
+            by_pos.setdefault((p, ch), []).append(i)
+        for ch in set(w):
+            if "a" <= ch <= "z":  # same letters a `letters_to_mask` mask can hold
+                by_letter[ord(ch) - 97].append(i)
+    return WordIndex(
+        words=ws,
+        letter_bits=tuple(_pack_bits(ix, n) for ix in by_letter),
+        len_bits={k: _pack_bits(ix, n) for k, ix in by_len.items()},
+        pos_bits={k: _pack_bits(ix, n) for k, ix in by_pos.items()},
+    )
+
+
+_FALLBACK_INDEX = build_word_index(_FALLBACK_WORDS)
+
+
+@lru_cache(maxsize=8)
+def _load_word_index_files(difficulty: str) -> WordIndex:
+    return build_word_index(_load_wordlist_files(difficulty))
+
+
+def load_word_index(difficulty: str = "medium") -> WordIndex:
+    """
+    `WordIndex` over `load_wordlist(difficulty)`, built once per difficulty.
+
+    Like `load_wordlist`, only indexes of words read from files are cached per
+    difficulty; the built-in fallback maps to the prebuilt `_FALLBACK_INDEX`.
+    """
+    try:
+        return _load_word_index_files(difficulty)
+    except _NoWordlist:
+        return _FALLBACK_INDEX
+
+
+def clear_wordlist_caches() -> None:
+    """Forget cached wordlists and their indexes (e.g. after editing the files)."""
+    _load_wordlist_files.cache_clear()
+    _load_word_index_files.cache_clear()
 
 
 def pick_local_word(difficulty: str = "medium", seed: int | None = None) -> str:
@@ -70,6 +181,7 @@ def pick_local_word(difficulty: str = "medium", seed: int | None = None) -> str:
         Difficulty key ("easy" | "medium" | "hard"). Unknown keys fall back to "medium".
     seed : int | None
         Optional temporary seed for reproducible picks during tests or demos.
+        Without one, the module-level `_RNG` is used (no reseeding per pick).
 
     Returns
     -------
@@ -77,5 +189,5 @@ def pick_local_word(difficulty: str = "medium", seed: int | None = None) -> str:
         A lowercase word from the local lists (never empty, due to fallbacks).
     """
     words = load_wordlist(difficulty)
-    rng = random.Random(seed)
+    rng = random.Random(seed) if seed is not None else _RNG
     return rng.choice(words)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from openai import OpenAI
+
+
+@lru_cache(maxsize=1)
+def get_client(api_key: str) -> OpenAI:
+    """
+    Return a process-wide OpenAI client for `api_key`.
+
+    Notes
+    -----
+    - Reusing one client keeps its HTTP connection pool (and TLS sessions) warm
+      across hint/coach/picker/review calls instead of rebuilding them per request.
+    - Keyed by `api_key` so a changed key yields a fresh client.
+    """
+    return OpenAI(api_key=api_key)
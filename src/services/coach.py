@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import os
-from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, List, Set, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Union
 
-from openai import OpenAI
+from src import config
+from src.services._client import get_client
 from src.core.engine import mask_word  # to display a user-visible mask
+from src.core.state import letters_to_mask
+from src.core.wordlist import WordIndex, build_word_index
 
 
 @dataclass(frozen=True)
@@ -18,67 +20,97 @@ class CoachSuggestion:
     candidates_considered: int  # candidate word count after filtering
 
 
-def _filter_candidates(secret: str, guessed: Set[str], candidates: Iterable[str]) -> List[str]:
+def _filter_candidates(secret: str, secret_mask: int, guessed_mask: int, index: WordIndex) -> int:
     """
-    Filter the candidate list to those consistent with the current mask & guesses.
+    Return the bitset (bit i <=> `index.words[i]`) of candidates consistent with
+    the current mask & guesses.
 
     Rules
     -----
     - Length must match the secret.
     - Any letter that is a *wrong* guess (not in the secret) must not appear in the candidate.
     - Any letter that is a *correct* guess must appear in the candidate at the same revealed positions.
+
+    Each rule is a bitwise op on the index's bitset columns: start from the
+    words of the right length, clear every word containing a wrong letter, and
+    intersect with the words showing each revealed letter at its position. With
+    no guesses yet (every new game's opening move) the length column is the
+    answer as-is.
+    """
+    alive = index.len_bits.get(len(secret), 0)
+    if not guessed_mask or not alive:
+        return alive
+
+    correct_mask = secret_mask & guessed_mask
+    wrong_mask = guessed_mask & ~secret_mask
+
+    letter_bits = index.letter_bits
+    for i in range(26):
+        if wrong_mask >> i & 1:
+            alive &= ~letter_bits[i]
+
+    pos_bits = index.pos_bits
+    for p, ch in enumerate(secret):
+        if correct_mask >> (ord(ch) - 97) & 1:
+            alive &= pos_bits.get((p, ch), 0)
+    return alive
+
+
+@lru_cache(maxsize=64)
+def _filter_candidates_cached(
+    secret: str, secret_mask: int, guessed_mask: int, index: WordIndex
+) -> int:
+    """
+    Memoized `_filter_candidates` for long-lived indexes (e.g. `load_word_index`).
+
+    Keyed by `(secret, guessed_mask)` plus the index's identity, so repeated
+    requests for the same game state skip the work; a new game or guess simply
+    produces a new key.
+    """
+    return _filter_candidates(secret, secret_mask, guessed_mask, index)
+
+
+def _prefilter(secret: str, secret_mask: int, guessed_mask: int, candidates: Iterable[str]) -> List[str]:
+    """
+    Cheaply drop words of the wrong length or containing a wrong letter.
+
+    Used before indexing a one-off candidate list, so only plausible words pay
+    for `build_word_index`; the exact rules are still applied by `_filter_candidates`.
     """
-    correct = set(secret) & guessed
-    wrong = guessed - set(secret)
     L = len(secret)
+    wrong_mask = guessed_mask & ~secret_mask
+    if not wrong_mask:
+        return [w for w in candidates if len(w) == L]
+    return [w for w in candidates if len(w) == L and not letters_to_mask(w) & wrong_mask]
+
 
-    filtered: List[str] = []
-    for w in candidates:
-        if len(w) != L:
-            continue
-        # Reject words containing any wrong letters
-        if any(ch in w for ch in wrong):
-            continue
-        # Enforce positions of revealed (correct) letters
-        ok = True
-        for i, ch in enumerate(secret):
-            if ch in correct and w[i] != ch:
-                ok = False
-                break
-        if ok:
-            filtered.append(w)
-    return filtered
-
-
-def _score_letters(remaining: List[str], guessed: Set[str]) -> Counter:
+def _score_letters(alive: int, guessed_mask: int, index: WordIndex) -> List[int]:
     """
     Score unguessed letters by how often they occur across remaining candidates.
 
+    Returns a 26-slot list where slot i is the score of chr(ord('a') + i);
+    guessed letters score 0.
+
     Note
     ----
     We count *presence* per word (not raw multiplicity) to prefer informative letters.
+    `alive` is the bitset of remaining candidates, so each letter's score is one
+    AND + popcount against its column in `index.letter_bits`.
     """
-    scores: Counter = Counter()
-    for w in remaining:
-        for ch in set(w):                 # presence, not multiplicity
-            if ch.isalpha() and ch not in guessed:
-                scores[ch] += 1
-    return scores
+    bits = index.letter_bits
+    return [0 if guessed_mask >> i & 1 else (alive & bits[i]).bit_count() for i in range(26)]
 
 
-def _best_letter(scores: Counter) -> str | None:
+def _best_letter(counts: Sequence[int]) -> str | None:
     """Pick the letter with the highest score; break ties alphabetically."""
-    if not scores:
-        return None
-    max_score = max(scores.values())
-    candidates = [ch for ch, sc in scores.items() if sc == max_score]
-    return sorted(candidates)[0]  # deterministic
+    i = max(range(26), key=counts.__getitem__)  # first maximum = lowest index
+    return chr(97 + i) if counts[i] > 0 else None
 
 
-def _local_reason(secret: str, guessed: Set[str], remaining: List[str], letter: str, score: int) -> str:
-    """A deterministic, non-LLM explanation sentence."""
-    m = mask_word(secret, guessed)
-    denom = max(1, len(remaining))
+def _local_reason(secret: str, guessed_mask: int, remaining: int, letter: str, score: int) -> str:
+    """A deterministic, non-LLM explanation sentence (`remaining` is the candidate count)."""
+    m = mask_word(secret, guessed_mask)
+    denom = max(1, remaining)
     pct = (score / denom) * 100.0
     return (
         f"Try **{letter.upper()}** — among {denom} words matching the pattern `{m}`, "
@@ -92,13 +124,11 @@ def _llm_reason(mask: str, top_letter: str, remaining_count: int) -> str | None:
 
     We do NOT disclose the secret word; we only pass the public mask and counts.
     """
-    api_key = os.getenv("OPENAI_API_KEY", "")
-    offline = os.getenv("OFFLINE_MODE", "true").lower() == "true"
-    if offline or not api_key:
+    if config.OFFLINE or not config.API_KEY:
         return None
 
-    client = OpenAI(api_key=api_key)
-    model = os.getenv("MODEL_NAME", "gpt-4o-mini")
+    client = get_client(config.API_KEY)
+    model = config.MODEL_NAME or "gpt-4o-mini"
 
     user = (
         "You are coaching a Hangman player. "
@@ -119,25 +149,42 @@ def _llm_reason(mask: str, top_letter: str, remaining_count: int) -> str | None:
         return None
 
 
-def suggest_next_letter(secret: str, guessed: Set[str], candidates: Iterable[str]) -> CoachSuggestion:
+def suggest_next_letter(
+    secret: str,
+    guessed_mask: int,
+    candidates: Union[WordIndex, Iterable[str]],
+    secret_mask: Optional[int] = None,
+) -> CoachSuggestion:
     """
     Compute the next-letter suggestion from remaining candidates, with an LLM reason.
 
     Steps
     -----
-    1) Filter candidate words by current knowledge (mask + guessed sets).
+    1) Filter candidate words by current knowledge (mask + guessed-letter bitmask).
     2) Score letters by cross-word presence; pick the highest scoring unguessed letter.
     3) Produce a one-sentence rationale using the LLM; fallback to a local sentence.
-    """
-    remaining = _filter_candidates(secret, guessed, candidates)
-    scores = _score_letters(remaining, guessed)
-    letter = _best_letter(scores) or "e"  # classic fallback
 
-    mask = mask_word(secret, guessed)
-    score = scores.get(letter, 0)
-    llm_text = _llm_reason(mask, letter, len(remaining))
+    `candidates` may be a prebuilt `WordIndex`; a plain iterable of words is indexed on the fly.
+    Pass `secret_mask` (e.g. `GameState.secret_mask`) to reuse the cached letter mask of `secret`.
+    """
+    if secret_mask is None:
+        secret_mask = letters_to_mask(secret)
+    if isinstance(candidates, WordIndex):
+        index = candidates
+        alive = _filter_candidates_cached(secret, secret_mask, guessed_mask, index)
+    else:
+        # One-off list: prefilter, then index only the survivors (not worth caching).
+        index = build_word_index(_prefilter(secret, secret_mask, guessed_mask, candidates))
+        alive = _filter_candidates(secret, secret_mask, guessed_mask, index)
+    remaining = alive.bit_count()
+    counts = _score_letters(alive, guessed_mask, index)
+    letter = _best_letter(counts) or "e"  # classic fallback
+
+    mask = mask_word(secret, guessed_mask)
+    score = counts[ord(letter) - 97]
+    llm_text = _llm_reason(mask, letter, remaining)
     if llm_text:
-        return CoachSuggestion(letter=letter, text=llm_text, used_llm=True, candidates_considered=len(remaining))
+        return CoachSuggestion(letter=letter, text=llm_text, used_llm=True, candidates_considered=remaining)
 
-    local_text = _local_reason(secret, guessed, remaining, letter, score)
-    return CoachSuggestion(letter=letter, text=local_text, used_llm=False, candidates_considered=len(remaining))
+    local_text = _local_reason(secret, guessed_mask, remaining, letter, score)
+    return CoachSuggestion(letter=letter, text=local_text, used_llm=False, candidates_considered=remaining)
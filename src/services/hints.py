@@ -1,35 +1,33 @@
 from __future__ import annotations
 
-import os
-import re
 from typing import Optional
 
-from openai import OpenAI
+from src import config
+from src.services._client import get_client
 
 # Reject only if the hint literally contains the secret word (case-insensitive).
-def _contains_answer(text: str, secret: str) -> bool:
-    return secret.lower() in (text or "").lower()
+# `secret_folded` must already be casefolded; the caller folds it once per request.
+def _contains_answer(text: str, secret_folded: str) -> bool:
+    return secret_folded in (text or "").casefold()
 
-def _local_fallback_hint(word: str) -> str:
+def local_fallback_hint(word: str) -> str:
     """Always-available local hint (simple and safe)."""
     return f"The word has {len(word)} letters and starts with '{word[0].upper()}'."
 
-def llm_hint(word: str, model: Optional[str] = None, temperature: float = 0.8) -> str:
+def llm_hint_or_none(word: str, model: Optional[str] = None, temperature: float = 0.8) -> Optional[str]:
     """
-    Return ONE hint for `word` using an LLM; fallback locally on failure.
+    Return ONE hint for `word` from the LLM, or None if the LLM was not used.
 
     Very permissive rule:
     - Accept any text as long as it does NOT contain the secret word itself.
-    - On any error or rule violation, return a deterministic local hint.
+    - Offline / missing key, any error, or a rule violation -> None, so callers
+      can tell a real LLM hint from `local_fallback_hint` (e.g. to cache only the former).
     """
-    # Offline or missing key -> fallback
-    api_key = os.getenv("OPENAI_API_KEY", "")
-    offline = os.getenv("OFFLINE_MODE", "true").lower() == "true"
-    if offline or not api_key:
-        return _local_fallback_hint(word)
+    if config.OFFLINE or not config.API_KEY:
+        return None
 
-    client = OpenAI(api_key=api_key)
-    mdl = model or os.getenv("MODEL_NAME", "gpt-4o")
+    client = get_client(config.API_KEY)
+    mdl = model or config.MODEL_NAME or "gpt-4o"
 
     system = "You are a helpful Hangman clue-giver."
     user = (
@@ -48,14 +46,22 @@ def llm_hint(word: str, model: Optional[str] = None, temperature: float = 0.8) -
         )
         text = (resp.choices[0].message.content or "").strip()
         # Only forbid directly containing the answer
-        if not text or _contains_answer(text, word):
-            return _local_fallback_hint(word)
+        if not text or _contains_answer(text, word.casefold()):
+            return None
         # Trim extreme verbosity (soft cap ~25 words)
         words = text.split()
         if len(words) > 25:
             text = " ".join(words[:25])
         return text
     except Exception:
-        return _local_fallback_hint(word)
+        return None
+
+def llm_hint(word: str, model: Optional[str] = None, temperature: float = 0.8) -> str:
+    """
+    Return ONE hint for `word` using an LLM; fallback locally on failure.
+
+    On any error or rule violation, returns the deterministic `local_fallback_hint`.
+    """
+    return llm_hint_or_none(word, model, temperature) or local_fallback_hint(word)
 
-__all__ = ["llm_hint"]
+__all__ = ["llm_hint", "llm_hint_or_none", "local_fallback_hint"]
@@ -1,13 +1,73 @@
 from __future__ import annotations
 
-import os
-import re
-from typing import Optional, Tuple
+import asyncio
+from typing import Optional, Set
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-# Strict validator: only lowercase a–z, length policy enforced separately
-_LOWER_AZ = re.compile(r"^[a-z]+$")
+from src import config
+from src.core.state import is_az
+
+# Strict validation: only lowercase a–z (`is_az`), plus this length policy
+_MIN_LEN, _MAX_LEN = 3, 24  # 24 matches the UI's guess input limit
+_WRAPPERS = "\"'`. \t\r\n"  # quotes/punctuation models like to wrap words in
+_HEDGE_AFTER_S = 2.0  # a one-word completion normally returns well within this
+
+
+async def _ask_once(client: AsyncOpenAI, model: str, prompt: str) -> Optional[str]:
+    """Issue one picker request; returns the validated word or None on error/invalid reply."""
+    try:
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=20,
+        )
+        # Tighten: strip wrapping quotes/spaces, force lowercase, then validate in one match
+        word = (resp.choices[0].message.content or "").strip(_WRAPPERS).lower()
+    except Exception:
+        return None  # API error or malformed reply (e.g. no choices)
+    if not (_MIN_LEN <= len(word) <= _MAX_LEN and is_az(word)):
+        return None
+    return word
+
+
+async def _ask_hedged(api_key: str, model: str, prompt: str, attempts: int) -> Optional[str]:
+    """
+    Send one picker request; add another (up to `attempts` in flight) only when
+    the previous ones failed or none answered within `_HEDGE_AFTER_S`.
+
+    The common case costs exactly one billed completion. A slow or failing
+    attempt is overlapped by the next one instead of waited out in sequence.
+    Requests still pending once a word arrives are cancelled, but the server
+    may already have charged for them.
+    """
+    # The async client's connection pool is bound to the running event loop,
+    # so it is scoped to this call rather than shared via `get_client()`.
+    async with AsyncOpenAI(api_key=api_key) as client:
+        pending: Set[asyncio.Task] = set()
+        launched = 0
+        try:
+            while True:
+                if launched < attempts:
+                    pending.add(asyncio.create_task(_ask_once(client, model, prompt)))
+                    launched += 1
+                if not pending:
+                    return None
+                # Once all attempts are out, just wait for them to finish
+                timeout = _HEDGE_AFTER_S if launched < attempts else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for t in done:
+                    word = t.result()
+                    if word:
+                        return word
+        finally:
+            for t in pending:
+                t.cancel()
+            # Let cancellations settle before the client closes its connections
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 def pick_with_llm(difficulty: str = "medium", retries: int = 2, model: Optional[str] = None) -> Optional[str]:
@@ -18,11 +78,11 @@ def pick_with_llm(difficulty: str = "medium", retries: int = 2, model: Optional[
     ------
     - OFFLINE_MODE=true or missing OPENAI_API_KEY -> returns None immediately.
     - Prompts the model to output exactly ONE word (lowercase, a–z only).
-    - Validates with regex + length bounds; retries a few times; then gives up.
+    - Validates with regex + length bounds; sends one request and only adds
+      another (up to `retries + 1` total) after a failure or a slow reply,
+      keeping the first usable word; otherwise gives up.
     """
-    api_key = os.getenv("OPENAI_API_KEY", "")
-    offline = os.getenv("OFFLINE_MODE", "true").lower() == "true"
-    if offline or not api_key:
+    if config.OFFLINE or not config.API_KEY:
         return None
 
     prompt = (
@@ -30,24 +90,9 @@ def pick_with_llm(difficulty: str = "medium", retries: int = 2, model: Optional[
         "It should be different each time. Output only the word in lowercase."
         )
 
-    client = OpenAI(api_key=api_key)
-    mdl = model or os.getenv("MODEL_NAME", "gpt-4o")
+    mdl = model or config.MODEL_NAME or "gpt-4o"
 
-    attempts = retries + 1
-    for _ in range(attempts):
-        try:
-            resp = client.chat.completions.create(
-                model=mdl,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=20,
-            )
-            word = (resp.choices[0].message.content or "").strip()
-            # Tighten: strip quotes/spaces and force lowercase
-            word = word.replace('"', "").replace("'", "").strip().lower()
-            return word
-        except Exception:
-            # Ignore and retry
-            pass
-
-    return None  # let caller fallback to local picker
+    # Streamlit runs the script in a thread without an event loop, so a
+    # private loop per call is safe here.
+    word = asyncio.run(_ask_hedged(config.API_KEY, mdl, prompt, retries + 1))
+    return word  # None lets caller fallback to local picker
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import os
-from typing import List, Dict, Any, Optional
+from typing import List, Optional
 
-from openai import OpenAI
+from src import config
+from src.core.state import HistoryEntry
+from src.services._client import get_client
 
 
-def _local_fallback_review(
-    history: List[Dict[str, Any]],
+def local_fallback_review(
+    history: List[HistoryEntry],
     secret: str,
     won: bool,
     mistakes: int,
@@ -17,10 +18,9 @@ def _local_fallback_review(
     Deterministic local review when LLM is unavailable or fails.
     Produces 3 short bullet points.
     """
-    steps = len(history)
-    hits = sum(1 for h in history if h.get("hit"))
-    wrongs = sum(1 for h in history if not h.get("hit"))
-    last_mask = history[-1]["mask"] if history else "_" * len(secret)
+    hits = sum(1 for h in history if h.hit)
+    wrongs = sum(1 for h in history if not h.hit)
+    last_mask = history[-1].mask if history else "_" * len(secret)
 
     verdict = "You won—nice pattern narrowing!" if won else f"You lost—the word was '{secret}'."
     return (
@@ -31,58 +31,52 @@ def _local_fallback_review(
     )
 
 
-def _format_history_compact(history: List[Dict[str, Any]]) -> str:
+def _format_history_compact(history: List[HistoryEntry]) -> str:
     """
     Compress history into a concise, LLM-friendly string.
     Example item: "1) L:e -> _ p p _ e | wrong=0"
     """
     lines = []
     for i, h in enumerate(history, start=1):
-        t = h.get("type")
-        g = h.get("guess")
-        hit = "✓" if h.get("hit") else "×"
-        mask = h.get("mask")
-        wc = h.get("wrong_count")
-        if t == "letter":
-            lines.append(f"{i}) L:{g}{hit} -> {mask} | wrong={wc}")
-        else:
-            lines.append(f"{i}) W:{g}{hit} -> {mask} | wrong={wc}")
+        hit = "✓" if h.hit else "×"
+        tag = "L" if h.type == "letter" else "W"
+        lines.append(f"{i}) {tag}:{h.guess}{hit} -> {h.mask} | wrong={h.wrong_count}")
     return "\n".join(lines)
 
 
-def generate_review(
-    history: List[Dict[str, Any]],
+def llm_review_or_none(
+    history: List[HistoryEntry],
     secret: str,
     won: bool,
     mistakes: int,
     difficulty: str = "medium",
     temperature: float = 0.4,
-) -> str:
+) -> Optional[str]:
     """
-    Generate a short post-game review.
+    Ask the LLM for a short post-game review; None if the LLM was not used.
 
     Behavior
     --------
-    - If OFFLINE_MODE=true or key missing -> returns a local, deterministic review.
-    - Otherwise, asks an LLM to produce ~3 short paragraphs:
+    - Asks for ~3 short paragraphs:
         1) Key turning points (what reduced the search space)
         2) Missed opportunities / what to try earlier
         3) Concrete next-game tips (letter strategy, whole-word timing)
+    - Returns None when OFFLINE_MODE=true or the key is missing, on any error,
+      or on an empty reply, so callers can tell a real review from
+      `local_fallback_review` (e.g. to cache only the former).
     - Never reveal the secret word if the player lost? Here we DO allow naming
       the word on loss since the app already reveals it. If you prefer otherwise,
       remove 'secret' from the prompt when lost.
     """
-    api_key = os.getenv("OPENAI_API_KEY", "")
-    offline = os.getenv("OFFLINE_MODE", "true").lower() == "true"
-    if offline or not api_key:
-        return _local_fallback_review(history, secret, won, mistakes, difficulty)
+    if config.OFFLINE or not config.API_KEY:
+        return None
 
-    client = OpenAI(api_key=api_key)
-    model = os.getenv("MODEL_NAME", "gpt-4o-mini")
+    client = get_client(config.API_KEY)
+    model = config.MODEL_NAME or "gpt-4o-mini"
 
     outcome = "won" if won else "lost"
     hist = _format_history_compact(history)
-    mask_final = history[-1]["mask"] if history else "_" * len(secret)
+    mask_final = history[-1].mask if history else "_" * len(secret)
 
     sys = (
         "You are a concise strategy coach for Hangman. Provide clear, actionable feedback."
@@ -112,6 +106,26 @@ def generate_review(
         # Soft cap for verbosity
         if len(text.split()) > 160:
             text = " ".join(text.split()[:160])
-        return text
+        return text or None
     except Exception:
-        return _local_fallback_review(history, secret, won, mistakes, difficulty)
+        return None
+
+
+def generate_review(
+    history: List[HistoryEntry],
+    secret: str,
+    won: bool,
+    mistakes: int,
+    difficulty: str = "medium",
+    temperature: float = 0.4,
+) -> str:
+    """
+    Generate a short post-game review.
+
+    Uses `llm_review_or_none`; if OFFLINE_MODE=true, the key is missing or the
+    LLM call fails, returns the local, deterministic `local_fallback_review`.
+    """
+    return (
+        llm_review_or_none(history, secret, won, mistakes, difficulty, temperature)
+        or local_fallback_review(history, secret, won, mistakes, difficulty)
+    )
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from src import config
+
+
+def _fake_client(content):
+    """Stand-in for `OpenAI()` whose chat completion returns `content` (or raises it)."""
+    def create(**kw):
+        if isinstance(content, Exception):
+            raise content
+        msg = types.SimpleNamespace(content=content)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg)])
+    completions = types.SimpleNamespace(create=create)
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+
+
+@pytest.fixture
+def online(monkeypatch):
+    """Pretend an API key is configured; `online(module, content)` fakes that module's client."""
+    monkeypatch.setattr(config, "OFFLINE", False)
+    monkeypatch.setattr(config, "API_KEY", "test-key")
+
+    def use(module, content):
+        monkeypatch.setattr(module, "get_client", lambda _key: _fake_client(content))
+    return use
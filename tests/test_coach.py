@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from src import config
+from src.core.state import letters_to_mask
+from src.core.wordlist import build_word_index
+from src.services.coach import _filter_candidates, suggest_next_letter
+
+# Hand-checked pool: five 5-letter words plus two shorter ones.
+WORDS = ["apple", "ample", "angle", "maple", "cider", "pear", "plum"]
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    # The coach phrases its rationale locally when offline; no API calls in tests.
+    monkeypatch.setattr(config, "OFFLINE", True)
+
+
+def _alive(secret: str, guessed: str) -> list:
+    ix = build_word_index(WORDS)
+    bits = _filter_candidates(secret, letters_to_mask(secret), letters_to_mask(guessed), ix)
+    return [w for i, w in enumerate(ix.words) if bits >> i & 1]
+
+
+@pytest.mark.parametrize("guessed, expected", [
+    ("", ["apple", "ample", "angle", "maple", "cider"]),   # length only
+    ("ez", ["apple", "ample", "angle", "maple"]),         # e revealed at the end; z wrong
+    ("en", ["apple", "ample", "maple"]),                  # n wrong drops "angle"
+    ("p", ["apple"]),                                     # p revealed at positions 1 and 2
+    ("q", ["apple", "ample", "angle", "maple", "cider"]),  # wrong letter nobody has
+])
+def test_filter_candidates(guessed, expected):
+    assert _alive("apple", guessed) == expected
+
+
+def test_filter_candidates_no_match():
+    assert _alive("kiwis", "k") == []
+
+
+def test_suggest_opening_move():
+    s = suggest_next_letter("apple", 0, build_word_index(WORDS))
+    assert s.letter == "e"  # in all five 5-letter candidates
+    assert s.candidates_considered == 5
+    assert s.used_llm is False
+
+
+def test_suggest_after_guesses_breaks_ties_alphabetically():
+    # Remaining: apple, ample, maple -> a, p, l in all three (m in two); "a" wins the tie.
+    s = suggest_next_letter("apple", letters_to_mask("en"), build_word_index(WORDS))
+    assert s.letter == "a"
+    assert s.candidates_considered == 3
+
+
+def test_suggest_never_repeats_a_guessed_letter():
+    s = suggest_next_letter("apple", letters_to_mask("aen"), build_word_index(WORDS))
+    assert s.letter in ("l", "p")
+
+
+def test_suggest_plain_list_matches_index():
+    guessed = letters_to_mask("ez")
+    a = suggest_next_letter("apple", guessed, WORDS)
+    b = suggest_next_letter("apple", guessed, build_word_index(WORDS))
+    assert (a.letter, a.candidates_considered) == (b.letter, b.candidates_considered)
+
+
+def test_suggest_without_candidates_falls_back():
+    s = suggest_next_letter("kiwis", letters_to_mask("k"), WORDS)
+    assert s.letter == "e"
+    assert s.candidates_considered == 0
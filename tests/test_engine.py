@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.engine import guess_letter, guess_word, mask_word, new_game
+from src.core.state import GameState, letters_to_mask
+
+
+def _game(word: str = "apple", max_wrong: int = 6) -> GameState:
+    return new_game("medium", picker_fn=lambda _: word, max_wrong=max_wrong)
+
+
+def _play(state: GameState, letters: str) -> GameState:
+    for ch in letters:
+        state = guess_letter(state, ch)
+    return state
+
+
+def test_new_game_normalizes_picked_word():
+    game = _game("  Apple ")
+    assert game.secret_word == "apple"
+    assert game.status == "playing"
+    assert game.guessed_mask == 0 and game.wrong_count == 0
+
+
+@pytest.mark.parametrize("bad", ["", "app1e", "café", "two words"])
+def test_new_game_falls_back_on_invalid_pick(bad):
+    assert _game(bad).secret_word == "python"
+
+
+def test_guess_letter_hit_and_miss():
+    game = guess_letter(_game(), "p")
+    assert game.wrong_count == 0
+    assert game.guessed == frozenset("p")
+
+    game = guess_letter(game, "z")
+    assert game.wrong_count == 1
+    assert game.guessed == frozenset("pz")
+    assert game.guessed_display == "p, z"
+    assert game.status == "playing"
+
+
+def test_guess_letter_is_case_insensitive():
+    assert guess_letter(_game(), "P").guessed == frozenset("p")
+
+
+def test_repeated_letter_is_a_no_op():
+    game = guess_letter(_game(), "z")
+    assert guess_letter(game, "z") is game
+    assert guess_letter(game, "Z") is game
+
+
+@pytest.mark.parametrize("bad", ["", "ab", "1", "é", " ", None])
+def test_invalid_letter_is_ignored(bad):
+    game = _game()
+    assert guess_letter(game, bad) is game
+
+
+def test_win_by_letters():
+    game = _play(_game(), "aple")
+    assert game.status == "won"
+    assert game.wrong_count == 0
+
+
+def test_lose_after_max_wrong():
+    game = _play(_game(max_wrong=3), "xyz")
+    assert game.status == "lost"
+    assert game.wrong_count == 3
+
+
+def test_finished_game_ignores_guesses():
+    lost = _play(_game(max_wrong=1), "x")
+    assert lost.status == "lost"
+    assert guess_letter(lost, "a") is lost
+    assert guess_word(lost, "apple") is lost
+
+    won = guess_word(_game(), "apple")
+    assert guess_letter(won, "z") is won
+
+
+def test_guess_word_correct_reveals_everything():
+    game = guess_word(guess_letter(_game(), "z"), " APPLE ")
+    assert game.status == "won"
+    assert game.wrong_count == 1
+    assert mask_word(game.secret_word, game.guessed_mask) == "a p p l e"
+    assert game.guessed_display == "a, e, l, p, z"
+
+
+def test_guess_word_wrong_costs_one_strike():
+    game = guess_word(_game(), "ample")
+    assert game.status == "playing"
+    assert game.wrong_count == 1
+    assert game.guessed_mask == 0
+
+
+def test_guess_word_wrong_can_lose():
+    assert guess_word(_game(max_wrong=1), "ample").status == "lost"
+
+
+@pytest.mark.parametrize("bad", ["", "app1e", "café", None])
+def test_invalid_word_is_ignored(bad):
+    game = _game()
+    assert guess_word(game, bad) is game
+
+
+def test_mask_word():
+    assert mask_word("apple", 0) == "_ _ _ _ _"
+    assert mask_word("apple", letters_to_mask("pe")) == "_ p p _ e"
+    assert mask_word("apple", letters_to_mask("zq")) == "_ _ _ _ _"
+    assert mask_word("apple", letters_to_mask("aple")) == "a p p l e"
+
+
+def test_transitions_match_a_validated_state():
+    # States built via the engine's unchecked path must equal a normally constructed one.
+    game = _play(_game(), "pz")
+    rebuilt = GameState(
+        secret_word="apple",
+        guessed_mask=letters_to_mask("pz"),
+        wrong_count=1,
+        max_wrong=6,
+        status="playing",
+    )
+    assert game == rebuilt
+    assert game.secret_mask == rebuilt.secret_mask
+    assert game.guessed_display == rebuilt.guessed_display
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from src import config
+from src.services import hints
+
+
+def test_offline_uses_no_llm(monkeypatch):
+    monkeypatch.setattr(config, "OFFLINE", True)
+    assert hints.llm_hint_or_none("apple") is None
+    assert hints.llm_hint("apple") == hints.local_fallback_hint("apple")
+
+
+def test_llm_hint_is_returned(online):
+    online(hints, "  A red or green fruit.  ")
+    assert hints.llm_hint_or_none("apple") == "A red or green fruit."
+    assert hints.llm_hint("apple") == "A red or green fruit."
+
+
+@pytest.mark.parametrize("content", ["", "   ", None, "Think APPLE pie.", RuntimeError("boom")])
+def test_unusable_reply_is_none(online, content):
+    online(hints, content)
+    assert hints.llm_hint_or_none("apple") is None
+    assert hints.llm_hint("apple") == hints.local_fallback_hint("apple")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import types
+
+import pytest
+
+from src import config
+from src.services import llm_picker
+
+
+class _FakeAsyncOpenAI:
+    """
+    Stand-in for `AsyncOpenAI`: the n-th completion request plays `script[n]`,
+    a `(delay_seconds, reply)` pair where reply is the message content, an
+    exception to raise, or `_NO_CHOICES` for a response without choices.
+    """
+    script: list = []
+    calls: list = []     # request numbers, in the order they were sent
+    cancelled: list = []
+    closed = False
+
+    def __init__(self, api_key):
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        type(self).closed = True
+
+    async def _create(self, **kw):
+        n = len(self.calls)
+        self.calls.append(n)
+        delay, reply = self.script[n]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(n)
+            raise
+        if isinstance(reply, Exception):
+            raise reply
+        if reply is _NO_CHOICES:
+            return types.SimpleNamespace(choices=[])
+        msg = types.SimpleNamespace(content=reply)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg)])
+
+
+_NO_CHOICES = object()
+
+
+@pytest.fixture
+def picker(monkeypatch):
+    """`picker(*script)` runs `pick_with_llm()` (retries=2) against the scripted fake."""
+    monkeypatch.setattr(config, "OFFLINE", False)
+    monkeypatch.setattr(config, "API_KEY", "test-key")
+    monkeypatch.setattr(llm_picker, "AsyncOpenAI", _FakeAsyncOpenAI)
+    monkeypatch.setattr(llm_picker, "_HEDGE_AFTER_S", 0.05)
+
+    def run(*script):
+        _FakeAsyncOpenAI.script = list(script)
+        _FakeAsyncOpenAI.calls = []
+        _FakeAsyncOpenAI.cancelled = []
+        _FakeAsyncOpenAI.closed = False
+        return llm_picker.pick_with_llm(retries=2)
+    return run
+
+
+def test_offline_sends_nothing(monkeypatch, picker):
+    monkeypatch.setattr(config, "OFFLINE", True)
+    assert picker((0, "planet")) is None
+    assert _FakeAsyncOpenAI.calls == []
+
+
+def test_first_reply_valid_sends_one_request(picker):
+    assert picker((0, "planet"), (0, "stream"), (0, "python")) == "planet"
+    assert _FakeAsyncOpenAI.calls == [0]
+    assert _FakeAsyncOpenAI.closed
+
+
+def test_all_attempts_fail(picker):
+    boom = RuntimeError("boom")
+    assert picker((0, boom), (0, boom), (0, boom)) is None
+    assert _FakeAsyncOpenAI.calls == [0, 1, 2]  # retries + 1, then give up
+
+
+def test_failure_is_retried_immediately(picker):
+    assert picker((0, RuntimeError("boom")), (0, "stream")) == "stream"
+    assert _FakeAsyncOpenAI.calls == [0, 1]
+
+
+def test_slow_request_is_overtaken_by_a_hedge(picker):
+    assert picker((5, "planet"), (0, "stream"), (0, "python")) == "stream"
+    assert _FakeAsyncOpenAI.calls == [0, 1]
+    assert _FakeAsyncOpenAI.cancelled == [0]  # the slow one is cancelled and awaited
+    assert _FakeAsyncOpenAI.closed
+
+
+@pytest.mark.parametrize("bad", [_NO_CHOICES, None, "", "two words", "pl4net"])
+def test_unusable_reply_moves_on(picker, bad):
+    assert picker((0, bad), (0, "stream")) == "stream"
+    assert _FakeAsyncOpenAI.calls == [0, 1]
+
+
+def test_only_unusable_replies_give_none(picker):
+    assert picker((0, _NO_CHOICES), (0, None), (0, "x")) is None
+    assert _FakeAsyncOpenAI.calls == [0, 1, 2]
+
+
+@pytest.mark.parametrize("reply, word", [
+    ("planet", "planet"),
+    ("  Planet\n", "planet"),            # whitespace stripped, lowercased
+    ('"planet".', "planet"),             # wrapping quotes / trailing period
+    ("`'PLANET'`", "planet"),
+    ("cat", "cat"),                      # 3 letters: shortest accepted
+    ("a" * 24, "a" * 24),                # 24 letters: longest accepted (UI input limit)
+])
+def test_reply_validation_accepts(picker, reply, word):
+    assert picker((0, reply)) == word
+
+
+@pytest.mark.parametrize("reply", ["ox", "a" * 25, "café", "pla-net", "planet!", "pla net"])
+def test_reply_validation_rejects(picker, reply):
+    assert picker((0, reply), (0, reply), (0, reply)) is None
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from src import config
+from src.core.state import HistoryEntry
+from src.services import review
+
+HISTORY = [
+    HistoryEntry("letter", "e", True, "_ _ _ _ e", 0),
+    HistoryEntry("word", "ample", False, "_ _ _ _ e", 1),
+]
+ARGS = (HISTORY, "apple", False, 1, "easy")
+
+
+def test_local_fallback_review():
+    text = review.local_fallback_review(*ARGS)
+    assert "the word was 'apple'" in text
+    assert "1 correct guess" in text and "1 wrong guess" in text
+    assert "`_ _ _ _ e`" in text
+
+
+def test_format_history_compact():
+    assert review._format_history_compact(HISTORY) == (
+        "1) L:e✓ -> _ _ _ _ e | wrong=0\n2) W:ample× -> _ _ _ _ e | wrong=1"
+    )
+
+
+def test_offline_uses_no_llm(monkeypatch):
+    monkeypatch.setattr(config, "OFFLINE", True)
+    assert review.llm_review_or_none(*ARGS) is None
+    assert review.generate_review(*ARGS) == review.local_fallback_review(*ARGS)
+
+
+def test_llm_review_is_returned(online):
+    online(review, " Good game. ")
+    assert review.llm_review_or_none(*ARGS) == "Good game."
+    assert review.generate_review(*ARGS) == "Good game."
+
+
+@pytest.mark.parametrize("content", ["", "  \n ", None, RuntimeError("boom")])
+def test_unusable_reply_is_none(online, content):
+    online(review, content)
+    assert review.llm_review_or_none(*ARGS) is None
+    assert review.generate_review(*ARGS) == review.local_fallback_review(*ARGS)
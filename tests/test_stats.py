@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.core.stats import StatsStore, empty_stats
+
+
+def test_record_reset_reload_round_trip(tmp_path):
+    path = tmp_path / "stats.json"
+    store = StatsStore(path)
+    assert store.snapshot() == empty_stats()
+    assert not path.exists()  # nothing is written until a round is recorded
+
+    store.record(won=True, mistakes=2)
+    store.record(won=False, mistakes=6)
+    expected = {"games": 2, "wins": 1, "losses": 1, "mistakes": 8}
+    assert store.snapshot() == expected
+    assert json.loads(path.read_text(encoding="utf-8")) == expected
+    assert StatsStore(path).snapshot() == expected  # survives a restart
+
+    store.reset()
+    assert store.snapshot() == empty_stats()
+    assert StatsStore(path).snapshot() == empty_stats()
+    assert [p.name for p in tmp_path.iterdir()] == ["stats.json"]  # no temp files left
+
+
+def test_snapshot_is_a_copy(tmp_path):
+    store = StatsStore(tmp_path / "stats.json")
+    store.snapshot()["games"] = 99
+    assert store.snapshot()["games"] == 0
+
+
+def test_unreadable_file_starts_from_zero(tmp_path):
+    path = tmp_path / "stats.json"
+    path.write_text("not json", encoding="utf-8")
+    assert StatsStore(path).snapshot() == empty_stats()
+
+    path.write_text(json.dumps({"games": 3, "wins": "x", "losses": -1}), encoding="utf-8")
+    assert StatsStore(path).snapshot() == {"games": 3, "wins": 0, "losses": 0, "mistakes": 0}
+
+
+def test_creates_missing_directory(tmp_path):
+    path = tmp_path / "nested" / "stats.json"
+    StatsStore(path).record(won=True, mistakes=0)
+    assert StatsStore(path).snapshot()["wins"] == 1
+
+
+def test_failed_write_leaves_counters_unchanged(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("", encoding="utf-8")
+    store = StatsStore(blocker / "stats.json")  # parent is a file: every write fails
+
+    for _ in range(3):
+        with pytest.raises(OSError):
+            store.record(won=True, mistakes=1)
+    assert store.snapshot() == empty_stats()
+
+    with pytest.raises(OSError):
+        store.reset()
+    assert store.snapshot() == empty_stats()
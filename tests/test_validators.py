@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.state import (
+    GameState,
+    is_az,
+    letter_bit,
+    letters_to_mask,
+    mask_to_display,
+    mask_to_letters,
+)
+
+
+@pytest.mark.parametrize("text, ok", [
+    ("apple", True),
+    ("a", True),
+    ("", False),
+    ("Apple", False),
+    ("app1e", False),
+    ("café", False),
+    ("two words", False),
+])
+def test_is_az(text, ok):
+    assert is_az(text) is ok
+
+
+def test_letter_bits_and_masks():
+    assert letter_bit("a") == 1
+    assert letter_bit("z") == 1 << 25
+    assert letters_to_mask("abca") == 0b111
+    assert letters_to_mask("a-é!z") == letter_bit("a") | letter_bit("z")  # non a–z ignored
+    assert mask_to_letters(letters_to_mask("tea")) == frozenset("tea")
+    assert mask_to_display(letters_to_mask("tea")) == "a, e, t"
+    assert mask_to_display(0) == ""
+
+
+def test_game_state_normalizes_fields():
+    state = GameState(secret_word=" Apple ", guessed_mask=letters_to_mask("ap") | 1 << 30)
+    assert state.secret_word == "apple"
+    assert state.secret_mask == letters_to_mask("aple")
+    assert state.guessed_mask == letters_to_mask("ap")  # bits beyond z dropped
+    assert state.guessed_display == "a, p"
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"secret_word": ""},
+    {"secret_word": "app1e"},
+    {"secret_word": "café"},
+    {"secret_word": "apple", "max_wrong": 0},
+    {"secret_word": "apple", "wrong_count": -1},
+    {"secret_word": "apple", "status": "paused"},
+])
+def test_game_state_rejects_invalid_fields(kwargs):
+    with pytest.raises(ValueError):
+        GameState(**kwargs)
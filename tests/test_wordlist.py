@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core import wordlist
+from src.core.wordlist import build_word_index, load_word_index, load_wordlist, pick_local_word
+
+
+def _members(bits: int, words) -> list:
+    return [w for i, w in enumerate(words) if bits >> i & 1]
+
+
+def test_build_word_index_columns():
+    words = ["apple", "pear", "plum", "kiwi"]
+    ix = build_word_index(words)
+    assert ix.words == tuple(words)
+    assert _members(ix.letter_bits[ord("p") - 97], words) == ["apple", "pear", "plum"]
+    assert _members(ix.letter_bits[ord("z") - 97], words) == []
+    assert _members(ix.len_bits[4], words) == ["pear", "plum", "kiwi"]
+    assert _members(ix.pos_bits[(0, "p")], words) == ["pear", "plum"]
+    assert _members(ix.pos_bits[(3, "i")], words) == ["kiwi"]
+
+
+def test_build_word_index_ignores_non_az_letters():
+    ix = build_word_index(["café"])
+    assert ix.letter_bits[ord("e") - 97] == 0
+    assert ix.letter_bits[ord("c") - 97] == 1
+
+
+def test_build_word_index_empty():
+    ix = build_word_index([])
+    assert ix.words == ()
+    assert all(b == 0 for b in ix.letter_bits)
+    assert ix.len_bits == {} and ix.pos_bits == {}
+
+
+def test_pick_local_word_seeded_is_reproducible():
+    assert pick_local_word("easy", seed=7) == pick_local_word("easy", seed=7)
+    assert pick_local_word("easy").isalpha()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(wordlist, "_DATA_DIR", tmp_path)
+    wordlist.clear_wordlist_caches()
+    yield tmp_path
+    wordlist.clear_wordlist_caches()
+
+
+def test_wordlist_files_are_cached(data_dir):
+    (data_dir / "easy.txt").write_text("Apple\n\n  pear \n", encoding="utf-8")
+    assert load_wordlist("easy") == ("apple", "pear")
+    (data_dir / "easy.txt").write_text("plum\n", encoding="utf-8")
+    assert load_wordlist("easy") == ("apple", "pear")  # cached until cleared
+    assert load_word_index("easy") is load_word_index("easy")
+    wordlist.clear_wordlist_caches()
+    assert load_wordlist("easy") == ("plum",)
+
+
+def test_missing_difficulty_falls_back_to_medium(data_dir):
+    (data_dir / "medium.txt").write_text("stream\n", encoding="utf-8")
+    assert load_wordlist("hard") == ("stream",)
+    assert load_wordlist("nonsense") == ("stream",)
+
+
+def test_builtin_fallback_is_not_cached(data_dir):
+    assert load_wordlist("easy") == ("python", "stream", "planet")
+    assert load_word_index("easy").words == ("python", "stream", "planet")
+    (data_dir / "easy.txt").write_text("kiwi\n", encoding="utf-8")
+    assert load_wordlist("easy") == ("kiwi",)
+    assert load_word_index("easy").words == ("kiwi",)
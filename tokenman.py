@@ -1,55 +1,143 @@
 from __future__ import annotations
 
-import os
-import secrets
+from copy import copy
+from pathlib import Path
+
 import streamlit as st
 
 from dotenv import load_dotenv
 load_dotenv(override=False)  # Load .env into process env
 
+# --- Settings (env snapshot; must be imported after load_dotenv) ---
+from src import config
+
 # --- Core game imports ---
 from src.core.engine import new_game, mask_word, guess_letter, guess_word
-from src.core.state import GameState
-from src.core.wordlist import load_wordlist
+from src.core.state import GameState, HistoryEntry, is_az, letter_bit
+from src.core.stats import StatsStore
+from src.core.wordlist import load_word_index, pick_local_word
 
 # --- Generative AI services ---
-from src.services.hints import llm_hint             # Plan A: AI hint (with local fallback)
+from src.services.hints import llm_hint_or_none, local_fallback_hint  # Plan A: AI hint (with local fallback)
 from src.services.llm_picker import pick_with_llm   # Plan B: AI word picker (with fallback)
 from src.services.coach import suggest_next_letter  # AI Coach (letter + rationale)
-from src.services.review import generate_review     # Post-game AI Review
+from src.services.review import llm_review_or_none, local_fallback_review  # Post-game AI Review
 
 
 # =======================================
-# Local word picking (no cache, true random)
+# Local word picking (fresh random pick per game)
 # =======================================
 
 def pick_local_word_plain(difficulty: str = "medium") -> str:
     """
-    Pick one word freshly without caching; uses cryptographic randomness.
+    Pick one word freshly for each game (the wordlist itself is cached; the pick is not).
+    The RNG lives in `src.core.wordlist`, so it is not reseeded on every script rerun.
     """
-    words = load_wordlist(difficulty)
-    return secrets.choice(words) if words else "python"
+    return pick_local_word(difficulty)
+
+
+# =======================================
+# Cached AI calls (dedupe repeat clicks)
+# =======================================
+
+class _NoLLMResult(Exception):
+    """Raised inside a cached call so `st.cache_data` stores nothing for it."""
+
+
+# Only genuine LLM results are cached: a failed/offline call raises out of the
+# cached function (exceptions are never cached), so the next click retries the
+# LLM instead of reusing the local fallback for an hour.
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_llm_hint(word: str) -> str:
+    """`llm_hint_or_none` memoized per secret word, so re-clicking reuses the last round-trip."""
+    text = llm_hint_or_none(word)
+    if text is None:
+        raise _NoLLMResult
+    return text
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_review(history: tuple, secret: str, won: bool, mistakes: int, difficulty: str) -> str:
+    """`llm_review_or_none` memoized per finished round (the history tuple pins the round)."""
+    text = llm_review_or_none(list(history), secret, won, mistakes, difficulty)
+    if text is None:
+        raise _NoLLMResult
+    return text
+
+
+def _ai_hint(word: str) -> str:
+    """Hint for `word`: cached LLM hint, else the local fallback (not cached)."""
+    try:
+        return _cached_llm_hint(word)
+    except _NoLLMResult:
+        return local_fallback_hint(word)
+
+
+def _ai_review(history: tuple, secret: str, won: bool, mistakes: int, difficulty: str) -> str:
+    """Review for a finished round: cached LLM review, else the local fallback (not cached)."""
+    try:
+        return _cached_review(history, secret, won, mistakes, difficulty)
+    except _NoLLMResult:
+        return local_fallback_review(list(history), secret, won, mistakes, difficulty)
 
 
 # =======================================
 # Session-state helpers & game management
 # =======================================
 
-def _init_stats() -> None:
-    """Ensure a stats dict exists in session state."""
-    st.session_state.setdefault("stats", {"games": 0, "wins": 0, "losses": 0, "mistakes": 0})
+@st.cache_resource
+def _stats_store() -> StatsStore:
+    """Process-wide stats file, shared by all sessions; written only when a round ends."""
+    return StatsStore(Path("stats.json"))
+
+
+@st.fragment
+def _render_stats() -> None:
+    """
+    Stats panel. Runs as a fragment, so "Reset stats" reruns only this panel
+    instead of the whole script (board, coach, masks).
+
+    The counters are shared by every session, so resetting wipes them for all
+    visitors; the button is only offered when ALLOW_STATS_RESET=true.
+    """
+    with st.expander("📊 Stats", expanded=True):
+        s = _stats_store().snapshot()
+        games = s["games"]; wins = s["wins"]; losses = s["losses"]
+        winrate = (wins / games * 100.0) if games else 0.0
+        avg_mistakes = (s["mistakes"] / games) if games else 0.0
+
+        st.metric("Games", games)
+        c1, c2 = st.columns(2); c1.metric("Wins", wins); c2.metric("Losses", losses)
+        c3, c4 = st.columns(2); c3.metric("Win rate", f"{winrate:.1f}%"); c4.metric("Avg mistakes", f"{avg_mistakes:.2f}")
+
+        if config.ALLOW_STATS_RESET and st.button("♻️ Reset stats (all players)", key="btn_reset_stats"):
+            try:
+                _stats_store().reset()
+                st.success("Stats reset.")
+            except OSError as e:
+                st.warning(f"Could not reset stats ({e}).")
+
+
+# Per-round transient keys and their initial values (values are copied per session).
+_SS_DEFAULTS = {
+    "round_counted": False,
+    "ai_hint": None,
+    "hint_loading": False,
+    "coach_suggestion": None,
+    "coach_loading": False,
+    "history": [],        # record moves for review
+    "review_text": None,
+    "review_loading": False,
+}
 
 
 def _init_round_state() -> None:
     """Ensure per-round transient keys exist."""
-    st.session_state.setdefault("round_counted", False)
-    st.session_state.setdefault("ai_hint", None)
-    st.session_state.setdefault("hint_loading", False)
-    st.session_state.setdefault("coach_suggestion", None)
-    st.session_state.setdefault("coach_loading", False)
-    st.session_state.setdefault("history", [])        # record moves for review
-    st.session_state.setdefault("review_text", None)
-    st.session_state.setdefault("review_loading", False)
+    ss = st.session_state
+    for k, v in _SS_DEFAULTS.items():
+        if k not in ss:
+            ss[k] = copy(v)
 
 
 def _start_new_game(difficulty: str) -> None:
@@ -66,14 +154,8 @@ def _start_new_game(difficulty: str) -> None:
         st.session_state["word_source"] = "local"
 
     # Reset per-round state
-    st.session_state["round_counted"] = False
-    st.session_state["ai_hint"] = None
-    st.session_state["hint_loading"] = False
-    st.session_state["coach_suggestion"] = None
-    st.session_state["coach_loading"] = False
-    st.session_state["history"] = []
-    st.session_state["review_text"] = None
-    st.session_state["review_loading"] = False
+    for k, v in _SS_DEFAULTS.items():
+        st.session_state[k] = copy(v)
 
 
 def _ensure_game(difficulty: str) -> GameState:
@@ -82,11 +164,44 @@ def _ensure_game(difficulty: str) -> GameState:
         _start_new_game(difficulty)
     if "word_source" not in st.session_state:
         st.session_state["word_source"] = "unknown"
-    _init_stats()
     _init_round_state()
     return st.session_state["game"]
 
 
+# Widget callbacks run before the script reruns, so the page renders the new
+# state in a single pass instead of needing an explicit `st.rerun()`.
+
+def _clear_key(key: str) -> None:
+    """Button callback: reset one session-state slot (hint / coach / review)."""
+    st.session_state[key] = None
+
+
+def _submit_guess() -> None:
+    """Form callback: apply the submitted guess, then record it to history once for either kind."""
+    game: GameState = st.session_state["game"]
+    g = (st.session_state.get("guess_inp") or "").strip().lower()
+    # One check for both guess kinds: ASCII a–z only (`str.isalpha` would also accept
+    # letters like "é" that no secret can contain), capped at the input's max_chars.
+    if game.status != "playing" or not (is_az(g) and len(g) <= 24):
+        return
+    if len(g) == 1:
+        kind = "letter"
+        hit = bool(game.secret_mask & letter_bit(g))
+        new_game = guess_letter(game, g)
+    else:
+        kind = "word"
+        hit = g == game.secret_word
+        new_game = guess_word(game, g)
+    st.session_state["game"] = new_game
+    st.session_state["history"].append(HistoryEntry(
+        type=kind,
+        guess=g,
+        hit=hit,
+        mask=mask_word(new_game.secret_word, new_game.guessed_mask),
+        wrong_count=new_game.wrong_count,
+    ))
+
+
 # =========
 # The App
 # =========
@@ -98,46 +213,34 @@ def main() -> None:
     # ---- Sidebar ----
     with st.sidebar:
         st.header("Settings")
-        difficulty = st.selectbox("Difficulty", ["easy", "medium", "hard"], index=1)
-        if st.button("🔁 New Game", use_container_width=True):
+        difficulty = st.selectbox("Difficulty", ["easy", "medium", "hard"], index=1, key="difficulty")
+        if st.button("🔁 New Game", key="btn_new_game", use_container_width=True):
             _start_new_game(difficulty)
             st.rerun()
 
         # Stats panel
-        _init_stats()
-        with st.expander("📊 Stats", expanded=True):
-            s = st.session_state["stats"]
-            games = s["games"]; wins = s["wins"]; losses = s["losses"]
-            winrate = (wins / games * 100.0) if games else 0.0
-            avg_mistakes = (s["mistakes"] / games) if games else 0.0
-
-            st.metric("Games", games)
-            c1, c2 = st.columns(2); c1.metric("Wins", wins); c2.metric("Losses", losses)
-            c3, c4 = st.columns(2); c3.metric("Win rate", f"{winrate:.1f}%"); c4.metric("Avg mistakes", f"{avg_mistakes:.2f}")
-
-            if st.button("♻️ Reset stats"):
-                st.session_state["stats"] = {"games": 0, "wins": 0, "losses": 0, "mistakes": 0}
-                st.success("Stats reset.")
+        _render_stats()
 
-        # Debug env
+        # Debug env (the snapshot the services actually use; read once per process)
         with st.expander("Debug (env)"):
-            st.write("OFFLINE_MODE:", os.getenv("OFFLINE_MODE"))
-            st.write("Has OPENAI_API_KEY:", bool(os.getenv("OPENAI_API_KEY")))
-            st.write("MODEL_NAME:", os.getenv("MODEL_NAME"))
+            st.write("OFFLINE_MODE:", config.OFFLINE)
+            st.write("Has OPENAI_API_KEY:", bool(config.API_KEY))
+            st.write("MODEL_NAME:", config.MODEL_NAME)
+            st.write("ALLOW_STATS_RESET:", config.ALLOW_STATS_RESET)
 
     # Initialize / load current game
     game: GameState = _ensure_game(difficulty)
 
     # ---- Board ----
     st.subheader("Board")
-    st.markdown(f"**Word**: `{mask_word(game.secret_word, game.guessed)}`")
+    st.markdown(f"**Word**: `{mask_word(game.secret_word, game.guessed_mask)}`")
     st.caption(f"Mistakes: {game.wrong_count} / {game.max_wrong}")
 
     # Progress bar
     st.progress(game.wrong_count / game.max_wrong)
 
-    guessed_sorted = ", ".join(sorted(game.guessed)) or "(none)"
-    st.caption(f"Guessed letters: {guessed_sorted}")
+    # Built once per guess on the GameState; reruns just read it
+    st.caption(f"Guessed letters: {game.guessed_display or '(none)'}")
 
     # Source badge
     source = st.session_state.get("word_source", "unknown")
@@ -148,37 +251,34 @@ def main() -> None:
     else:
         st.markdown("**Source**: ❔ Unknown")
 
+    playing = game.status == "playing"
+
     # ---- Hint & Coach section ----
     with st.expander("Need a hint or coaching?"):
         st.caption("Use AI hint for semantic clues, or the Coach for a data-driven next-letter recommendation.")
 
-        st.session_state.setdefault("ai_hint", None)
-        st.session_state.setdefault("hint_loading", False)
-        st.session_state.setdefault("coach_suggestion", None)
-        st.session_state.setdefault("coach_loading", False)
-
         c1, c2 = st.columns(2)
         with c1:
-            if st.button("✨ Generate AI Hint", disabled=st.session_state["hint_loading"]):
+            if st.button("✨ Generate AI Hint", key="btn_hint", disabled=st.session_state["hint_loading"]):
                 st.session_state["hint_loading"] = True
                 with st.spinner("Thinking..."):
-                    st.session_state["ai_hint"] = llm_hint(game.secret_word)
+                    st.session_state["ai_hint"] = _ai_hint(game.secret_word)
                 st.session_state["hint_loading"] = False
-                st.rerun()
 
         with c2:
-            if st.button("🤖 Coach: Next Letter", disabled=st.session_state["coach_loading"] or game.status != "playing"):
+            # Coaching only applies mid-game: skip the widget entirely once the round ends
+            if playing and st.button("🤖 Coach: Next Letter", key="btn_coach", disabled=st.session_state["coach_loading"]):
                 st.session_state["coach_loading"] = True
                 with st.spinner("Analyzing remaining words..."):
-                    # Fresh candidate list without caching
-                    candidates = load_wordlist(difficulty)
+                    # Candidate pool is cached per difficulty (secret picking stays random)
+                    candidates = load_word_index(difficulty)
                     st.session_state["coach_suggestion"] = suggest_next_letter(
                         secret=game.secret_word,
-                        guessed=game.guessed,
+                        guessed_mask=game.guessed_mask,
                         candidates=candidates,
+                        secret_mask=game.secret_mask,
                     )
                 st.session_state["coach_loading"] = False
-                st.rerun()
 
         # Display results
         hint_text = st.session_state["ai_hint"] or "No AI hint yet."
@@ -196,58 +296,33 @@ def main() -> None:
         # Clear buttons
         cc1, cc2 = st.columns(2)
         with cc1:
-            if st.button("♻️ Clear Hint"):
-                st.session_state["ai_hint"] = None
-                st.rerun()
+            st.button("♻️ Clear Hint", key="btn_clear_hint", on_click=_clear_key, args=("ai_hint",))
         with cc2:
-            if st.button("♻️ Clear Coach"):
-                st.session_state["coach_suggestion"] = None
-                st.rerun()
+            st.button("♻️ Clear Coach", key="btn_clear_coach", on_click=_clear_key, args=("coach_suggestion",))
 
     # ---- Move input ----
-    st.subheader("Your move")
-    with st.form("guess_form", clear_on_submit=True):
-        guess_inp = st.text_input(
-            "Enter a single letter (A–Z) or guess the full word:",
-            max_chars=24,
-            help="Single-letter guesses update the mask; a wrong whole-word guess costs one strike.",
-        )
-        submitted = st.form_submit_button("Submit")
-        if submitted and game.status == "playing":
-            g = (guess_inp or "").strip().lower()
-            if g:
-                # Apply guess and record to history
-                if len(g) == 1 and g.isalpha():
-                    new_game = guess_letter(game, g)
-                    st.session_state["game"] = new_game
-                    st.session_state["history"].append({
-                        "type": "letter",
-                        "guess": g,
-                        "hit": g in game.secret_word,
-                        "mask": mask_word(new_game.secret_word, new_game.guessed),
-                        "wrong_count": new_game.wrong_count,
-                    })
-                elif g.isalpha():
-                    new_game = guess_word(game, g)
-                    st.session_state["game"] = new_game
-                    st.session_state["history"].append({
-                        "type": "word",
-                        "guess": g,
-                        "hit": (g == game.secret_word),
-                        "mask": mask_word(new_game.secret_word, new_game.guessed),
-                        "wrong_count": new_game.wrong_count,
-                    })
-            st.rerun()
+    # Only rendered while the round is live; a finished game has no moves left.
+    if playing:
+        st.subheader("Your move")
+        with st.form("guess_form", clear_on_submit=True):
+            st.text_input(
+                "Enter a single letter (A–Z) or guess the full word:",
+                max_chars=24,
+                help="Single-letter guesses update the mask; a wrong whole-word guess costs one strike.",
+                key="guess_inp",
+            )
+            # Applied in the callback so the board above already shows the new state
+            st.form_submit_button("Submit", key="btn_submit_guess", on_click=_submit_guess)
 
     # ---- Outcome banner + stats update ----
     game = st.session_state["game"]
     if game.status in ("won", "lost") and not st.session_state.get("round_counted", False):
-        st.session_state["stats"]["games"] += 1
-        st.session_state["stats"]["mistakes"] += game.wrong_count
-        if game.status == "won":
-            st.session_state["stats"]["wins"] += 1
-        else:
-            st.session_state["stats"]["losses"] += 1
+        try:
+            _stats_store().record(won=game.status == "won", mistakes=game.wrong_count)
+        except OSError as e:
+            # A read-only/broken working dir must not break the end-of-game screen
+            st.warning(f"Could not save stats ({e}); this round was not counted.")
+        # Counted (or given up on) once either way, so reruns don't retry the same round
         st.session_state["round_counted"] = True
 
     if game.status == "won":
@@ -259,32 +334,27 @@ def main() -> None:
     if game.status in ("won", "lost"):
         with st.expander("📝 AI Review"):
             st.caption("Get a brief, actionable debrief of this round.")
-            st.session_state.setdefault("review_text", None)
-            st.session_state.setdefault("review_loading", False)
 
             col_a, col_b = st.columns(2)
             with col_a:
-                if st.button("✨ Generate Review", disabled=st.session_state["review_loading"]):
+                if st.button("✨ Generate Review", key="btn_review", disabled=st.session_state["review_loading"]):
                     st.session_state["review_loading"] = True
                     with st.spinner("Analyzing your round..."):
-                        st.session_state["review_text"] = generate_review(
-                            history=st.session_state.get("history", []),
+                        st.session_state["review_text"] = _ai_review(
+                            history=tuple(st.session_state.get("history", [])),
                             secret=game.secret_word,
                             won=(game.status == "won"),
                             mistakes=game.wrong_count,
                             difficulty=difficulty,
                         )
                     st.session_state["review_loading"] = False
-                    st.rerun()
             with col_b:
-                if st.button("♻️ Clear Review"):
-                    st.session_state["review_text"] = None
-                    st.rerun()
+                st.button("♻️ Clear Review", key="btn_clear_review", on_click=_clear_key, args=("review_text",))
 
             if st.session_state["review_text"]:
                 st.write(st.session_state["review_text"])
 
-        st.button("Play again", on_click=_start_new_game, args=(difficulty,))
+        st.button("Play again", key="btn_play_again", on_click=_start_new_game, args=(difficulty,))
 
     st.divider()
     st.caption(